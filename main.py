@@ -272,8 +272,7 @@ class ContentScout:
             # Add filtered articles to pending approvals
             if relevant:
                 self.ui.show_info("Onay kuyruğuna ekleniyor...")
-                for r in relevant:
-                    self.storage.add_pending_approval(r['article'], r)
+                self.storage.add_pending_approvals([(r['article'], r) for r in relevant])
 
                 self.ui.show_success(f"{len(relevant)} makale onay bekliyor")
 
@@ -25,7 +25,7 @@ from .storage import (
     save_generated_content
 )
 from .logger import get_logger
-from .config_manager import config
+from .config_manager import config, load_prompt_file
 
 # Module logger
 logger = get_logger(__name__)
@@ -76,16 +76,13 @@ class ConceptManager:
 
     def _load_prompt(self, filename: str) -> str:
         """Load prompt from file or return default."""
-        prompt_path = self.base_path / "prompts" / filename
-
-        if prompt_path.exists():
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        prompt = load_prompt_file(filename)
+        if prompt is not None:
+            return prompt
+        if 'selection' in filename:
+            return self._get_default_selection_prompt()
         else:
-            if 'selection' in filename:
-                return self._get_default_selection_prompt()
-            else:
-                return self._get_default_content_prompt()
+            return self._get_default_content_prompt()
 
     def _get_default_selection_prompt(self) -> str:
         """Default concept selection prompt."""
@@ -218,6 +218,27 @@ def ensure_paths_exist() -> None:
             logger.warning(f"Could not create path {path}: {e}")
 
 
+@lru_cache(maxsize=None)
+def load_prompt_file(filename: str) -> Optional[str]:
+    """
+    Read a prompt template from the prompts directory.
+
+    Cached per process, so every framer and generator instance shares one read.
+
+    Args:
+        filename: Prompt file name, e.g. 'article_prompt.txt'
+
+    Returns:
+        File contents, or None if the file does not exist
+    """
+    prompt_path = config.base_path / "prompts" / filename
+    try:
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
 def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0,
           exceptions: tuple = (Exception,)):
     """
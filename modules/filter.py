@@ -22,7 +22,7 @@ from .storage import (
     get_unfiltered_articles
 )
 from .logger import get_logger
-from .config_manager import config, safe_json_parse
+from .config_manager import config, safe_json_parse, load_prompt_file
 from .claude_session import get_session, ClaudeSessionError
 
 # Module logger
@@ -76,14 +76,11 @@ class ArticleFilter:
 
     def _load_prompt(self, filename: str) -> str:
         """Load prompt from file."""
-        prompt_path = self.base_path / "prompts" / filename
-
-        if prompt_path.exists():
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        else:
+        prompt = load_prompt_file(filename)
+        if prompt is None:
             # Return default prompt if file doesn't exist
             return self._get_default_filter_prompt()
+        return prompt
 
     def _get_default_filter_prompt(self) -> str:
         """Get default filter prompt."""
@@ -17,11 +17,11 @@ from datetime import datetime, date
 from typing import List, Dict, Optional, Tuple
 
 from .storage import (
-    add_content_proposal, get_proposal_by_id, update_proposal_status,
+    add_content_proposals_bulk, get_proposal_by_id, update_proposal_status,
     get_article_by_id, save_content_to_file, generate_slug
 )
 from .logger import get_logger
-from .config_manager import config, Constants, safe_json_parse
+from .config_manager import config, Constants, safe_json_parse, load_prompt_file
 from .claude_session import get_session, ClaudeSessionError
 
 # Module logger
@@ -67,13 +67,10 @@ class ContentFramer:
 
     def _load_prompt(self, filename: str) -> str:
         """Load prompt from file."""
-        prompt_path = self.base_path / "prompts" / filename
-
-        if prompt_path.exists():
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        else:
-            raise FramerError(f"Prompt file not found: {prompt_path}")
+        prompt = load_prompt_file(filename)
+        if prompt is None:
+            raise FramerError(f"Prompt file not found: {self.base_path / 'prompts' / filename}")
+        return prompt
 
     def call_claude_cli(self, prompt: str) -> str:
         """
@@ -172,24 +169,16 @@ class ContentFramer:
             proposal_data = self.frame_article(article)
 
             if proposal_data:
-                # Save to database
-                proposal_id = add_content_proposal(
-                    article_id=proposal_data['article_id'],
-                    beirek_area=proposal_data['beirek_area'],
-                    beirek_subarea=proposal_data['beirek_subarea'],
-                    suggested_title=proposal_data['suggested_title'],
-                    content_angle=proposal_data['content_angle'],
-                    brief_description=proposal_data['brief_description'],
-                    target_audience=proposal_data['target_audience'],
-                    key_talking_points=proposal_data['key_talking_points'],
-                    confidence_score=proposal_data['confidence_score']
-                )
-
-                proposal_data['id'] = proposal_id
                 proposal_data['article_title'] = article.get('title', '')
                 proposal_data['source_name'] = article.get('source_name', '')
                 proposals.append(proposal_data)
 
+        # Save to database in a single write
+        if proposals:
+            proposal_ids = add_content_proposals_bulk(proposals)
+            for proposal_data, proposal_id in zip(proposals, proposal_ids):
+                proposal_data['id'] = proposal_id
+
         return proposals
 
     def get_area_full_name(self, area: str, subarea: str = None) -> tuple:
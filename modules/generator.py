@@ -24,11 +24,19 @@ from .storage import (
     get_storage
 )
 from .logger import get_logger
-from .config_manager import config, Constants
+from .config_manager import config, Constants, load_prompt_file
 
 # Module logger
 logger = get_logger(__name__)
 
+# Twitter thread parsing: a tweet starts with "1/", "1." or "Tweet 1"
+_TWEET_START_RE = re.compile(r'^(?:\d+[/\.]|Tweet \d+)', re.IGNORECASE)
+_TWEET_NUMBER_RE = re.compile(r'^(\d+)[/\.]\d*\s*:?\s*')
+_TWEET_PREFIX_RE = re.compile(r'^\d+[/\.]\s*\d*\s*')
+
+# Figures checked against the source by validate_content (amounts, capacities, years)
+_NUMBER_RE = re.compile(r'\$?\d+(?:,\d{3})*(?:\.\d+)?(?:\s*(?:MW|GW|million|billion|B|M|%|yıl|year))?', re.IGNORECASE)
+
 
 class GeneratorError(Exception):
     """Base exception for generator errors."""
@@ -73,13 +81,10 @@ class ContentGenerator:
 
     def _load_prompt(self, filename: str) -> str:
         """Load prompt from file or return default."""
-        prompt_path = self.base_path / "prompts" / filename
-
-        if prompt_path.exists():
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        else:
+        prompt = load_prompt_file(filename)
+        if prompt is None:
             return self._get_default_prompt(filename)
+        return prompt
 
     def _get_default_prompt(self, prompt_type: str) -> str:
         """Get default prompt based on type."""
@@ -319,7 +324,7 @@ KONU:
 
     def _format_twitter_thread(self, content: str) -> str:
         """Format and validate Twitter thread."""
-        lines = content.strip().split('\n')
+        lines = content.strip().splitlines()
         formatted_tweets = []
         current_tweet = []
 
@@ -329,10 +334,10 @@ KONU:
                 if current_tweet:
                     formatted_tweets.append(' '.join(current_tweet))
                     current_tweet = []
-            elif re.match(r'^\d+[/\.]', line) or re.match(r'^Tweet \d+', line, re.IGNORECASE):
+            elif _TWEET_START_RE.match(line):
                 if current_tweet:
                     formatted_tweets.append(' '.join(current_tweet))
-                current_tweet = [re.sub(r'^(\d+)[/\.]\d*\s*:?\s*', r'\1/ ', line)]
+                current_tweet = [_TWEET_NUMBER_RE.sub(r'\1/ ', line)]
             else:
                 current_tweet.append(line)
 
@@ -344,7 +349,7 @@ KONU:
         total = len(formatted_tweets)
         for i, tweet in enumerate(formatted_tweets, 1):
             # Remove existing numbering
-            tweet = re.sub(r'^\d+[/\.]\s*\d*\s*', '', tweet)
+            tweet = _TWEET_PREFIX_RE.sub('', tweet)
             tweet = f"{i}/{total} {tweet}"
 
             # Truncate if too long
@@ -648,8 +653,8 @@ KONU:
         warnings = []
 
         # Extract numbers from generated content
-        gen_numbers = set(re.findall(r'\$?\d+(?:,\d{3})*(?:\.\d+)?(?:\s*(?:MW|GW|million|billion|B|M|%|yıl|year))?', generated_content, re.IGNORECASE))
-        source_numbers = set(re.findall(r'\$?\d+(?:,\d{3})*(?:\.\d+)?(?:\s*(?:MW|GW|million|billion|B|M|%|yıl|year))?', source_content, re.IGNORECASE))
+        gen_numbers = set(_NUMBER_RE.findall(generated_content))
+        source_numbers = set(_NUMBER_RE.findall(source_content))
 
         # Check for numbers not in source
         suspicious_numbers = gen_numbers - source_numbers
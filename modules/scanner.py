@@ -26,8 +26,9 @@ from urllib.parse import urlparse, urljoin
 
 from .storage import (
     add_article, article_exists, get_active_sources,
-    add_source, update_source_last_checked, get_source_count,
-    start_scan, complete_scan, is_duplicate_title
+    add_source, update_source_last_checked, update_sources_last_checked,
+    get_source_count,
+    start_scan, complete_scan, is_duplicate_title, url_batch
 )
 from .logger import get_logger
 from .config_manager import config, Constants
@@ -482,12 +483,14 @@ class NewsScanner:
 
         return None
 
-    def scan_source(self, source: Dict) -> List[Dict]:
+    def scan_source(self, source: Dict, checked_ids: List[str] = None) -> List[Dict]:
         """
         Scan a single source (RSS only).
 
         Args:
             source: Source dict from database
+            checked_ids: Optional list collecting checked source IDs; when given,
+                the last checked timestamp is left for the caller to write in bulk
 
         Returns:
             List of new articles found
@@ -509,8 +512,11 @@ class NewsScanner:
             # Filter out already scanned articles
             new_articles = [a for a in articles if not article_exists(a['url'])]
 
-            # Update last checked
-            update_source_last_checked(source['id'])
+            # Update last checked (deferred to a single write when batching)
+            if checked_ids is not None:
+                checked_ids.append(source['id'])
+            else:
+                update_source_last_checked(source['id'])
 
             return new_articles
 
@@ -553,6 +559,7 @@ class NewsScanner:
         progress_lock = threading.Lock()
         progress_counter = [0]  # Use list for mutability in closure
         all_new_articles = []  # Thread-safe list for new articles
+        checked_source_ids = []  # Flushed once after all sources are scanned
 
         def process_source(source: Dict) -> Dict:
             """Process a single source (thread-safe)."""
@@ -567,7 +574,7 @@ class NewsScanner:
 
             try:
                 # Scan source
-                new_articles = self.scan_source(source)
+                new_articles = self.scan_source(source, checked_source_ids)
                 source_result['articles_found'] = len(new_articles)
 
                 # Save to database
@@ -607,13 +614,26 @@ class NewsScanner:
 
             return source_result
 
-        # Process sources (parallel or sequential)
-        if parallel and self.max_workers > 1:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(process_source, s): s for s in sources}
-
-                for future in as_completed(futures):
-                    source_result = future.result()
+        # Processed URL marks are written once when the batch exits
+        with url_batch():
+            # Process sources (parallel or sequential)
+            if parallel and self.max_workers > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {executor.submit(process_source, s): s for s in sources}
+
+                    for future in as_completed(futures):
+                        source_result = future.result()
+                        results['sources_scanned'] += 1
+                        results['articles_found'] += source_result['articles_found']
+                        results['new_articles'] += source_result['new_articles']
+                        results['duplicates_skipped'] += source_result['duplicates']
+                        results['articles'].extend(source_result.get('articles', []))
+                        if source_result['error']:
+                            results['errors'].append(f"{source_result['source_name']}: {source_result['error']}")
+            else:
+                # Sequential processing
+                for source in sources:
+                    source_result = process_source(source)
                     results['sources_scanned'] += 1
                     results['articles_found'] += source_result['articles_found']
                     results['new_articles'] += source_result['new_articles']
@@ -621,52 +641,44 @@ class NewsScanner:
                     results['articles'].extend(source_result.get('articles', []))
                     if source_result['error']:
                         results['errors'].append(f"{source_result['source_name']}: {source_result['error']}")
-        else:
-            # Sequential processing
-            for source in sources:
-                source_result = process_source(source)
-                results['sources_scanned'] += 1
-                results['articles_found'] += source_result['articles_found']
-                results['new_articles'] += source_result['new_articles']
-                results['duplicates_skipped'] += source_result['duplicates']
-                results['articles'].extend(source_result.get('articles', []))
-                if source_result['error']:
-                    results['errors'].append(f"{source_result['source_name']}: {source_result['error']}")
-
-        # Fetch from NewsData.io API
-        newsdata_articles = self._fetch_newsdata_articles()
-        if newsdata_articles:
-            for article in newsdata_articles:
-                # Check for duplicate titles if enabled
-                if self.check_duplicates and is_duplicate_title(
-                    article['title'],
-                    threshold=self.duplicate_threshold
-                ):
-                    results['duplicates_skipped'] += 1
-                    continue
-
-                # Check if URL already exists
-                if article_exists(article['url']):
-                    continue
-
-                article_id = add_article(
-                    source_id=None,  # NewsData articles don't have a source_id
-                    title=article['title'],
-                    url=article['url'],
-                    summary=article.get('summary'),
-                    published_at=article.get('published_at')
-                )
 
-                if article_id > 0:
-                    results['new_articles'] += 1
-                    results['articles_found'] += 1
-                    # Add to articles list for filtering
-                    article['id'] = article_id
-                    if not article.get('source_name'):
-                        article['source_name'] = 'NewsData.io'
-                    results['articles'].append(article)
+            # Write all last checked timestamps in one pass
+            update_sources_last_checked(checked_source_ids)
+
+            # Fetch from NewsData.io API
+            newsdata_articles = self._fetch_newsdata_articles()
+            if newsdata_articles:
+                for article in newsdata_articles:
+                    # Check for duplicate titles if enabled
+                    if self.check_duplicates and is_duplicate_title(
+                        article['title'],
+                        threshold=self.duplicate_threshold
+                    ):
+                        results['duplicates_skipped'] += 1
+                        continue
+
+                    # Check if URL already exists
+                    if article_exists(article['url']):
+                        continue
+
+                    article_id = add_article(
+                        source_id=None,  # NewsData articles don't have a source_id
+                        title=article['title'],
+                        url=article['url'],
+                        summary=article.get('summary'),
+                        published_at=article.get('published_at')
+                    )
+
+                    if article_id > 0:
+                        results['new_articles'] += 1
+                        results['articles_found'] += 1
+                        # Add to articles list for filtering
+                        article['id'] = article_id
+                        if not article.get('source_name'):
+                            article['source_name'] = 'NewsData.io'
+                        results['articles'].append(article)
 
-            logger.info(f"NewsData.io: Added {len(newsdata_articles)} potential articles")
+                logger.info(f"NewsData.io: Added {len(newsdata_articles)} potential articles")
 
         # Complete scan record
         complete_scan(
@@ -13,21 +13,82 @@ Directory Structure:
 """
 
 import json
+import os
 import re
+import time
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 import yaml
 import hashlib
+from secrets import token_hex
 import shutil
 from filelock import FileLock
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
 from .logger import get_logger
 from .config_manager import Constants, config
 
 # Module logger
 logger = get_logger(__name__)
 
+# Seconds a computed stats dict may be served from memory
+STATS_CACHE_TTL_SECONDS = 5
+
+# Pending URL marks that force a flush inside url_batch()
+URL_BATCH_FLUSH_SIZE = 100
+
+# Match json.dump(indent=2) output; tolerate non-string keys like the stdlib path
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+# Records the folder layout ensure_structure last created
+STRUCTURE_SENTINEL = '.structure'
+
+# C-accelerated emitter when libyaml is available
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Line width that never folds frontmatter values; libyaml rejects float('inf')
+_YAML_MAX_WIDTH = 2 ** 31 - 1
+
+# Content directories already created this process
+_created_dirs: set = set()
+
+
+def _file_stamp(path: Path) -> Optional[tuple]:
+    """
+    Identify the current version of a file for in-memory caches.
+
+    No single field is unique: mtime can repeat within a clock tick and
+    replace-based writes alternate between reused inode numbers. Comparing
+    (inode, mtime_ns, size) together means a stale hit needs all three to
+    repeat at once.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _fsync_dir(path: Path):
+    """Flush a directory entry so a completed rename survives a crash."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on some platforms (Windows)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 
 class FolderStorage:
     """
@@ -55,20 +116,41 @@ class FolderStorage:
 
         # Lock files for thread safety
         self.urls_lock = FileLock(str(self.processed_urls_file) + '.lock')
+
+        # In-process lock for the cached URL map; the file lock is only taken on flush
+        self._urls_mem_lock = threading.RLock()
         self.approvals_lock = FileLock(str(self.pending_approvals_file) + '.lock')
 
         # BEIREK areas mapping
         self.beirek_areas = config.beirek_areas
+        self._area_folder_cache: Dict[tuple, tuple] = {}
+
+        # Write generation, bumped on every save; cached stats are keyed on it
+        self._generation = 0
+        self._stats_cache: Dict[str, tuple] = {}
+
+        # Processed URL map cached in memory, validated by the file stamp
+        self._urls_cache: Optional[Dict[str, Dict]] = None
+        self._urls_stamp: Optional[tuple] = None
+        self._urls_batch_depth = 0
+        self._urls_unsaved = 0
+
+        # Sorted active sources, rebuilt when the sources file changes
+        self._active_sources: Optional[List[Dict]] = None
+        self._active_sources_stamp: Optional[tuple] = None
+
+        # Approval views (id index, approved awaiting generation), rebuilt on file change
+        self._approvals_index: Optional[Dict[str, Dict]] = None
+        self._approved_ungenerated: List[Dict] = []
+        self._approval_counts: Dict[str, int] = {}
+        self._approvals_index_stamp: Optional[tuple] = None
 
         # Ensure structure exists
         self.ensure_structure()
 
-    def ensure_structure(self):
-        """Create BEIREK folder structure if it doesn't exist."""
-        # Create data folder
-        self.data_path.mkdir(parents=True, exist_ok=True)
-
-        # Create content folder structure for all BEIREK areas
+    def _structure_paths(self) -> List[Path]:
+        """List the girdiler/raporlar leaf folders for every BEIREK subarea."""
+        paths = []
         for area_num, area_info in self.beirek_areas.items():
             if isinstance(area_info, dict):
                 area_name = area_info.get('name', '')
@@ -78,60 +160,206 @@ class FolderStorage:
 
                 for subarea_num, subarea_name in subareas.items():
                     subarea_folder = area_folder / f"{subarea_num}-{subarea_name}"
+                    paths.append(subarea_folder / self.inputs_folder)
+                    paths.append(subarea_folder / self.reports_folder)
+        return paths
+
+    def _structure_signature(self) -> str:
+        """Hash of everything that determines the folder layout."""
+        layout = {
+            'content_path': str(self.content_path),
+            'inputs_folder': self.inputs_folder,
+            'reports_folder': self.reports_folder,
+            'areas': self.beirek_areas
+        }
+        payload = json.dumps(layout, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
 
-                    # Create girdiler and raporlar folders
-                    (subarea_folder / self.inputs_folder).mkdir(parents=True, exist_ok=True)
-                    (subarea_folder / self.reports_folder).mkdir(parents=True, exist_ok=True)
+    def ensure_structure(self, force: bool = False):
+        """
+        Create BEIREK folder structure if it doesn't exist.
 
-        logger.info(f"Folder structure ensured at {self.content_path}")
+        A sentinel file in the data folder records the layout last created;
+        when it still matches the config the folder sweep is skipped.
+
+        Args:
+            force: Check every folder even if the sentinel matches
+        """
+        # Create data folder
+        self.data_path.mkdir(parents=True, exist_ok=True)
+
+        sentinel = self.data_path / STRUCTURE_SENTINEL
+        signature = self._structure_signature()
+        if not force and self.content_path.is_dir():
+            try:
+                if sentinel.read_text(encoding='utf-8') == signature:
+                    return
+            except OSError:
+                pass
+
+        # Only the deepest folders need mkdir; parents are created with them
+        missing = [path for path in self._structure_paths() if not path.is_dir()]
+        for path in missing:
+            path.mkdir(parents=True, exist_ok=True)
+
+        sentinel.write_text(signature, encoding='utf-8')
+        logger.info(f"Folder structure ensured at {self.content_path} ({len(missing)} folders created)")
 
     def _load_json(self, file_path: Path, default: Any = None) -> Any:
         """Load JSON file with default value if not exists."""
         try:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            # Parse from bytes; both parsers decode UTF-8 themselves
+            raw = file_path.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Could not load {file_path}: {e}")
         return default if default is not None else {}
 
     def _save_json(self, file_path: Path, data: Any):
-        """Save data to JSON file atomically."""
+        """
+        Save data to JSON file atomically and durably.
+
+        The payload goes to a per-thread temp file created exclusively, is
+        fsynced, renamed over the target, and the directory entry is synced.
+        """
         try:
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            temp_path = file_path.with_suffix('.tmp')
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-            temp_path.replace(file_path)
+            if orjson is not None:
+                payload = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+            else:
+                payload = json.dumps(data, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+
+            # Unique per thread so concurrent saves never share a temp file
+            temp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.unlink(missing_ok=True)  # Leftover from a crashed process with the same pid
+            fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                temp_path.replace(file_path)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+
+            _fsync_dir(file_path.parent)
+            self._generation += 1
         except Exception as e:
             logger.error(f"Could not save {file_path}: {e}")
             raise
 
+    def _get_cached_stats(self, key: str) -> Optional[Dict]:
+        """Return cached stats if no write happened and the TTL has not expired."""
+        entry = self._stats_cache.get(key)
+        if entry is None:
+            return None
+
+        generation, cached_at, value = entry
+        if generation != self._generation or time.monotonic() - cached_at >= STATS_CACHE_TTL_SECONDS:
+            return None
+        return dict(value)
+
+    def _set_cached_stats(self, key: str, value: Dict):
+        """Cache stats for the current write generation."""
+        self._stats_cache[key] = (self._generation, time.monotonic(), dict(value))
+
     # ==========================================================================
     # URL TRACKING
     # ==========================================================================
 
+    def _load_urls(self) -> Dict[str, Dict]:
+        """
+        Return the processed URL map, re-reading the file only when it changed.
+
+        The parsed map is kept in memory and validated against the file's
+        stamp, so repeated lookups during a scan skip the JSON decode.
+        """
+        stamp = _file_stamp(self.processed_urls_file)
+
+        if self._urls_cache is not None and stamp == self._urls_stamp:
+            return self._urls_cache
+
+        # Reload under the lock so a concurrent writer never mutates a stale map
+        with self._urls_mem_lock:
+            # Unsaved marks from an open batch must not be dropped by a reload
+            if self._urls_cache is None or (stamp != self._urls_stamp and not self._urls_unsaved):
+                data = self._load_json(self.processed_urls_file, {'urls': {}})
+                self._urls_cache = data.get('urls', {})
+                self._urls_stamp = stamp
+            return self._urls_cache
+
     def is_url_processed(self, url: str) -> bool:
         """Check if URL has been processed."""
-        with self.urls_lock:
-            data = self._load_json(self.processed_urls_file, {'urls': {}})
-            return url in data.get('urls', {})
+        return url in self._load_urls()
 
     def mark_url_processed(self, url: str, article_data: Dict = None):
         """Mark URL as processed with optional article data."""
+        self.mark_urls_processed([(url, article_data)])
+
+    def mark_urls_processed(self, items: List[tuple]):
+        """
+        Mark several URLs as processed with a single write.
+
+        Inside url_batch() the write is deferred until the batch exits or
+        URL_BATCH_FLUSH_SIZE marks have accumulated.
+
+        Args:
+            items: List of (url, article_data) tuples
+        """
+        if not items:
+            return
+
+        with self._urls_mem_lock:
+            urls = self._load_urls()
+            now = datetime.now().isoformat()
+
+            for url, article_data in items:
+                urls[url] = {
+                    'processed_at': now,
+                    'title': article_data.get('title', '') if article_data else '',
+                    'source': article_data.get('source_name', '') if article_data else ''
+                }
+            self._urls_unsaved += len(items)
+
+            if not self._urls_batch_depth or self._urls_unsaved >= URL_BATCH_FLUSH_SIZE:
+                self._flush_urls()
+
+    def _flush_urls(self):
+        """Write the cached URL map to disk. Caller must hold _urls_mem_lock."""
+        # The file lock is only needed while touching disk
         with self.urls_lock:
-            data = self._load_json(self.processed_urls_file, {'urls': {}})
-            data['urls'][url] = {
-                'processed_at': datetime.now().isoformat(),
-                'title': article_data.get('title', '') if article_data else '',
-                'source': article_data.get('source_name', '') if article_data else ''
-            }
-            self._save_json(self.processed_urls_file, data)
+            stamp = _file_stamp(self.processed_urls_file)
+
+            # Another process wrote since we loaded; URLs are only ever added, so merge
+            if stamp != self._urls_stamp:
+                data = self._load_json(self.processed_urls_file, {'urls': {}})
+                urls = data.get('urls', {})
+                urls.update(self._urls_cache)
+                self._urls_cache = urls
+
+            self._save_json(self.processed_urls_file, {'urls': self._urls_cache})
+            self._urls_stamp = _file_stamp(self.processed_urls_file)
+            self._urls_unsaved = 0
+
+    @contextmanager
+    def url_batch(self):
+        """Defer processed URL writes until the outermost batch exits."""
+        with self._urls_mem_lock:
+            self._urls_batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._urls_mem_lock:
+                self._urls_batch_depth -= 1
+                if not self._urls_batch_depth and self._urls_unsaved:
+                    self._flush_urls()
 
     def get_processed_urls_count(self) -> int:
         """Get count of processed URLs."""
-        data = self._load_json(self.processed_urls_file, {'urls': {}})
-        return len(data.get('urls', {}))
+        return len(self._load_urls())
 
     # ==========================================================================
     # PENDING APPROVALS
@@ -148,50 +376,131 @@ class FolderStorage:
         Returns:
             Approval ID
         """
+        return self.add_pending_approvals([(article, filter_result)])[0]
+
+    def add_pending_approvals(self, items: List[tuple]) -> List[str]:
+        """
+        Add several articles to pending approvals with a single write.
+
+        Args:
+            items: List of (article, filter_result) tuples
+
+        Returns:
+            Approval IDs in input order
+        """
+        return [approval['id'] for approval in self._append_approvals(items)]
+
+    def _append_approvals(self, items: List[tuple]) -> List[Dict]:
+        """
+        Append approval records under one lock and one save.
+
+        Each record gets a string 'id' and a sequential integer 'number'
+        drawn from the 'next_number' counter persisted in the approvals file.
+
+        Args:
+            items: List of (article, filter_result) tuples
+
+        Returns:
+            The new approval records in input order
+        """
+        if not items:
+            return []
+
         with self.approvals_lock:
             data = self._load_json(self.pending_approvals_file, {'pending': [], 'approved': [], 'rejected': []})
+            pending = data.setdefault('pending', [])
+            next_number = data.get('next_number') or self._max_approval_number(data) + 1
+            now = datetime.now().isoformat()
+            approvals = []
+
+            for article, filter_result in items:
+                approval = {
+                    'id': token_hex(6),
+                    'number': next_number,
+                    'article': {
+                        'title': article.get('title', ''),
+                        'url': article.get('url', ''),
+                        'summary': article.get('summary', ''),
+                        'source_name': article.get('source_name', ''),
+                        'published_at': str(article.get('published_at', ''))
+                    },
+                    'filter_result': {
+                        'score': filter_result.get('score', 0),
+                        'reason': filter_result.get('reason', ''),
+                        'beirek_area': filter_result.get('beirek_area', ''),
+                        'beirek_subarea': filter_result.get('beirek_subarea', ''),
+                        'confidence_score': filter_result.get('confidence_score', 0)
+                    },
+                    'created_at': now,
+                    'status': 'pending'
+                }
+                next_number += 1
+
+                pending.append(approval)
+                approvals.append(approval)
+
+            data['next_number'] = next_number
+            self._save_json(self.pending_approvals_file, data)
 
-            # Generate unique ID
-            approval_id = hashlib.md5(f"{article['url']}:{datetime.now().isoformat()}".encode()).hexdigest()[:12]
-
-            approval = {
-                'id': approval_id,
-                'article': {
-                    'title': article.get('title', ''),
-                    'url': article.get('url', ''),
-                    'summary': article.get('summary', ''),
-                    'source_name': article.get('source_name', ''),
-                    'published_at': str(article.get('published_at', ''))
-                },
-                'filter_result': {
-                    'score': filter_result.get('score', 0),
-                    'reason': filter_result.get('reason', ''),
-                    'beirek_area': filter_result.get('beirek_area', ''),
-                    'beirek_subarea': filter_result.get('beirek_subarea', ''),
-                    'confidence_score': filter_result.get('confidence_score', 0)
-                },
-                'created_at': datetime.now().isoformat(),
-                'status': 'pending'
-            }
+            return approvals
 
-            data['pending'].append(approval)
-            self._save_json(self.pending_approvals_file, data)
+    @staticmethod
+    def _max_approval_number(data: Dict) -> int:
+        """Highest approval number in files written before the counter existed."""
+        return max(
+            (approval.get('number', 0)
+             for bucket in ('pending', 'approved', 'rejected')
+             for approval in data.get(bucket, [])),
+            default=0
+        )
 
-            return approval_id
+    def get_pending_approvals(self, limit: int = None) -> List[Dict]:
+        """
+        Get pending approvals.
 
-    def get_pending_approvals(self) -> List[Dict]:
-        """Get all pending approvals."""
+        Args:
+            limit: Maximum number of approvals to return (all if None)
+        """
         data = self._load_json(self.pending_approvals_file, {'pending': []})
-        return data.get('pending', [])
+        return data.get('pending', [])[:limit]
 
-    def get_approval_by_id(self, approval_id: str) -> Optional[Dict]:
-        """Get approval by ID."""
-        data = self._load_json(self.pending_approvals_file, {'pending': [], 'approved': [], 'rejected': []})
+    def _refresh_approvals_view(self) -> bool:
+        """
+        Rebuild in-memory approval views if the approvals file changed.
 
-        for approval in data.get('pending', []) + data.get('approved', []) + data.get('rejected', []):
-            if approval.get('id') == approval_id:
-                return approval
-        return None
+        Returns:
+            False if the approvals file does not exist
+        """
+        stamp = _file_stamp(self.pending_approvals_file)
+        if stamp is None:
+            self._approvals_index = {}
+            self._approved_ungenerated = []
+            self._approval_counts = {'pending': 0, 'approved': 0, 'rejected': 0}
+            self._approvals_index_stamp = None
+            return False
+
+        # Every approval write replaces the file, so its stamp keys the views
+        if self._approvals_index is None or stamp != self._approvals_index_stamp:
+            data = self._load_json(self.pending_approvals_file, {'pending': [], 'approved': [], 'rejected': []})
+            self._approvals_index = {
+                approval.get('id'): approval
+                for bucket in ('pending', 'approved', 'rejected')
+                for approval in data.get(bucket, [])
+            }
+            self._approved_ungenerated = [a for a in data.get('approved', []) if not a.get('content_generated')]
+            self._approval_counts = {
+                bucket: len(data.get(bucket, []))
+                for bucket in ('pending', 'approved', 'rejected')
+            }
+            self._approvals_index_stamp = stamp
+        return True
+
+    def get_approval_by_id(self, approval_id: str) -> Optional[Dict]:
+        """Get approval by ID as a copy of the cached record."""
+        if not self._refresh_approvals_view():
+            return None
+        approval = self._approvals_index.get(approval_id)
+        return dict(approval) if approval is not None else None
 
     def approve_article(self, approval_id: str) -> bool:
         """
@@ -241,10 +550,23 @@ class FolderStorage:
 
             return False
 
-    def get_approved_articles(self) -> List[Dict]:
-        """Get all approved articles waiting for content generation."""
-        data = self._load_json(self.pending_approvals_file, {'approved': []})
-        return [a for a in data.get('approved', []) if not a.get('content_generated')]
+    def get_approved_articles(self, limit: int = None) -> List[Dict]:
+        """
+        Get approved articles waiting for content generation.
+
+        Args:
+            limit: Maximum number of articles to return (all if None)
+
+        Returns:
+            Shallow copies, so callers may annotate them without touching the cache
+        """
+        self._refresh_approvals_view()
+        return [dict(a) for a in self._approved_ungenerated[:limit]]
+
+    def get_approval_counts(self) -> Dict[str, int]:
+        """Get the number of pending, approved and rejected articles."""
+        self._refresh_approvals_view()
+        return dict(self._approval_counts)
 
     def mark_content_generated(self, approval_id: str, folder_path: str):
         """Mark approved article as content generated."""
@@ -275,6 +597,12 @@ class FolderStorage:
         Returns:
             Tuple of (area_folder_name, subarea_folder_name)
         """
+        # Folder names depend only on the areas config loaded at startup
+        key = (area, subarea)
+        cached = self._area_folder_cache.get(key)
+        if cached is not None:
+            return cached
+
         area_info = self.beirek_areas.get(str(area), {})
 
         if isinstance(area_info, dict):
@@ -288,6 +616,7 @@ class FolderStorage:
             area_folder = f"{area}-{area_info}" if area_info else str(area)
             subarea_folder = str(subarea) if subarea else ''
 
+        self._area_folder_cache[key] = (area_folder, subarea_folder)
         return area_folder, subarea_folder
 
     def save_article_input(self, article: Dict, area: str, subarea: str) -> str:
@@ -338,8 +667,7 @@ beirek_subarea: "{subarea}"
 {article.get('full_content', article.get('summary', ''))}
 """
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        file_path.write_text(content, encoding='utf-8')
 
         logger.info(f"Saved input article: {file_path}")
         return str(file_path)
@@ -404,16 +732,7 @@ beirek_subarea: "{subarea}"
 
     def _save_content_file(self, file_path: Path, content: str, frontmatter: Dict):
         """Save content with YAML frontmatter."""
-        fm_yaml = "---\n"
-        for key, value in frontmatter.items():
-            if isinstance(value, (list, dict)):
-                fm_yaml += f"{key}: {json.dumps(value, ensure_ascii=False)}\n"
-            else:
-                fm_yaml += f'{key}: "{value}"\n'
-        fm_yaml += "---\n\n"
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(fm_yaml + content)
+        file_path.write_text(add_frontmatter(content, frontmatter), encoding='utf-8')
 
     # ==========================================================================
     # SCAN LOG
@@ -423,7 +742,7 @@ beirek_subarea: "{subarea}"
         """Start a new scan and return scan ID."""
         data = self._load_json(self.scan_log_file, {'scans': []})
 
-        scan_id = hashlib.md5(datetime.now().isoformat().encode()).hexdigest()[:12]
+        scan_id = token_hex(6)
         scan = {
             'id': scan_id,
             'started_at': datetime.now().isoformat(),
@@ -441,7 +760,8 @@ beirek_subarea: "{subarea}"
         """Complete a scan record."""
         data = self._load_json(self.scan_log_file, {'scans': []})
 
-        for scan in data['scans']:
+        # The scan being completed is almost always the latest one
+        for scan in reversed(data['scans']):
             if scan.get('id') == scan_id:
                 scan['completed_at'] = datetime.now().isoformat()
                 scan['sources_scanned'] = sources_scanned
@@ -492,28 +812,51 @@ beirek_subarea: "{subarea}"
 
         return source_id
 
+    def _load_active_sources(self) -> List[Dict]:
+        """Active sources sorted by priority and name, cached until sources.json changes."""
+        stamp = _file_stamp(self.sources_file)
+
+        if self._active_sources is None or stamp != self._active_sources_stamp:
+            data = self._load_json(self.sources_file, {'sources': []})
+            active = [s for s in data['sources'] if s.get('is_active', True)]
+            active.sort(key=lambda x: (x.get('priority', 2), x.get('name', '')))
+            self._active_sources = active
+            self._active_sources_stamp = stamp
+        return self._active_sources
+
     def get_active_sources(self, priority: int = None) -> List[Dict]:
-        """Get all active sources."""
-        data = self._load_json(self.sources_file, {'sources': []})
-        sources = [s for s in data['sources'] if s.get('is_active', True)]
+        """Get all active sources as copies of the cached records."""
+        sources = self._load_active_sources()
 
         if priority is not None:
-            sources = [s for s in sources if s.get('priority') == priority]
-
-        return sorted(sources, key=lambda x: (x.get('priority', 2), x.get('name', '')))
+            return [dict(s) for s in sources if s.get('priority') == priority]
+        return [dict(s) for s in sources]
 
     def get_source_count(self) -> int:
         """Get total active source count."""
-        return len(self.get_active_sources())
+        return len(self._load_active_sources())
 
     def update_source_last_checked(self, source_id: str):
         """Update source last checked timestamp."""
+        self.update_sources_last_checked([source_id])
+
+    def update_sources_last_checked(self, source_ids: List[str]):
+        """
+        Update last checked timestamp for several sources in one write.
+
+        Args:
+            source_ids: Source IDs checked during the scan
+        """
+        if not source_ids:
+            return
+
+        ids = set(source_ids)
+        now = datetime.now().isoformat()
         data = self._load_json(self.sources_file, {'sources': []})
 
         for source in data['sources']:
-            if source.get('id') == source_id:
-                source['last_checked'] = datetime.now().isoformat()
-                break
+            if source.get('id') in ids:
+                source['last_checked'] = now
 
         self._save_json(self.sources_file, data)
 
@@ -523,31 +866,41 @@ beirek_subarea: "{subarea}"
 
     def get_stats(self) -> Dict:
         """Get overall statistics."""
+        cached = self._get_cached_stats('stats')
+        if cached is not None:
+            return cached
+
         stats = {
             'total_sources': self.get_source_count(),
             'total_urls_processed': self.get_processed_urls_count()
         }
 
         # Pending approvals stats
-        approvals_data = self._load_json(self.pending_approvals_file, {})
-        stats['pending_approvals'] = len(approvals_data.get('pending', []))
-        stats['approved_articles'] = len(approvals_data.get('approved', []))
-        stats['rejected_articles'] = len(approvals_data.get('rejected', []))
+        counts = self.get_approval_counts()
+        stats['pending_approvals'] = counts['pending']
+        stats['approved_articles'] = counts['approved']
+        stats['rejected_articles'] = counts['rejected']
 
-        # Scan stats
-        scan_data = self._load_json(self.scan_log_file, {'scans': []})
+        # Scan stats (one load serves both today's count and the last scan)
+        scans = self._load_json(self.scan_log_file, {'scans': []}).get('scans', [])
         today = date.today().isoformat()
-        stats['today_scans'] = len([s for s in scan_data.get('scans', [])
-                                   if s.get('started_at', '').startswith(today)])
+        # Scans are appended in start order, so today's are a suffix of the log
+        today_scans = 0
+        for scan in reversed(scans):
+            if scan.get('started_at', '') < today:
+                break
+            today_scans += 1
+        stats['today_scans'] = today_scans
 
         # Last scan info
-        last_scan = self.get_last_scan()
+        last_scan = scans[-1] if scans else None
         if last_scan:
             stats['last_scan_sources'] = last_scan.get('sources_scanned', 0)
             stats['last_scan_articles'] = last_scan.get('articles_found', 0)
             stats['last_scan_relevant'] = last_scan.get('articles_relevant', 0)
             stats['last_scan_status'] = last_scan.get('status', '')
 
+        self._set_cached_stats('stats', stats)
         return stats
 
 
@@ -582,6 +935,11 @@ def article_exists(url: str) -> bool:
     return get_storage().is_url_processed(url)
 
 
+def url_batch():
+    """Context manager deferring processed URL writes until it exits."""
+    return get_storage().url_batch()
+
+
 def add_article(source_id: str, title: str, url: str,
                 summary: str = None, published_at: datetime = None) -> int:
     """Add a new article (mark URL as processed)."""
@@ -622,6 +980,11 @@ def update_source_last_checked(source_id: str) -> None:
     get_storage().update_source_last_checked(source_id)
 
 
+def update_sources_last_checked(source_ids: List[str]) -> None:
+    """Update last checked timestamp for several sources at once."""
+    get_storage().update_sources_last_checked(source_ids)
+
+
 def get_source_count() -> int:
     """Get total source count."""
     return get_storage().get_source_count()
@@ -660,13 +1023,25 @@ def is_duplicate_title(new_title: str, threshold: float = 0.85, days: int = 7) -
 
 def get_unfiltered_articles(limit: int = 100) -> List[Dict]:
     """Get unfiltered articles (returns pending approvals for now)."""
-    return get_storage().get_pending_approvals()[:limit]
+    return get_storage().get_pending_approvals(limit)
 
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# Turkish to ASCII transliteration table for slugs
+_TR_TRANSLATION = str.maketrans({
+    'ı': 'i', 'ğ': 'g', 'ü': 'u', 'ş': 's', 'ö': 'o', 'ç': 'c',
+    'İ': 'i', 'Ğ': 'g', 'Ü': 'u', 'Ş': 's', 'Ö': 'o', 'Ç': 'c'
+})
+
+_SLUG_INVALID_CHARS_RE = re.compile(r'[^a-z0-9]+')
+
+# Parent references, path separators and characters invalid in file names
+_UNSAFE_PATH_RE = re.compile(r'\.\.|[\\/<>:"|?*]')
+
+
 def generate_slug(title: str) -> str:
     """
     Generate URL-friendly slug from title.
@@ -680,19 +1055,11 @@ def generate_slug(title: str) -> str:
     if not title:
         return 'untitled'
 
-    # Convert to lowercase
-    slug = title.lower()
-
-    # Replace Turkish characters
-    tr_map = {
-        'i': 'i', 'g': 'g', 'u': 'u', 's': 's', 'o': 'o', 'c': 'c',
-        'I': 'i', 'G': 'g', 'U': 'u', 'S': 's', 'O': 'o', 'C': 'c'
-    }
-    for tr_char, en_char in tr_map.items():
-        slug = slug.replace(tr_char, en_char)
+    # Transliterate Turkish characters in one pass, then lowercase
+    slug = title.translate(_TR_TRANSLATION).lower()
 
     # Replace non-alphanumeric with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
+    slug = _SLUG_INVALID_CHARS_RE.sub('-', slug)
 
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -709,22 +1076,49 @@ def sanitize_path_component(component: str) -> str:
     if not component:
         return ''
 
-    sanitized = component.replace('..', '').replace('/', '').replace('\\', '')
-    sanitized = re.sub(r'[<>:"|?*]', '', sanitized)
+    sanitized = _UNSAFE_PATH_RE.sub('', component)
     sanitized = sanitized.strip('. \t\n\r')
 
     return sanitized
 
 
 def save_content_to_file(content: str, file_path: str) -> bool:
-    """Save content to file."""
+    """
+    Save content to file atomically.
+
+    The text goes to a per-thread temp file beside the target, is fsynced and
+    renamed over it, so the file is either the old or the complete new version.
+    A failed write removes its temp file and leaves the target untouched.
+    """
     try:
         path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        parent = str(path.parent)
+        if parent not in _created_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(parent)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        payload = content.encode('utf-8')
 
+        # Unique per thread so concurrent writers of one path never share a temp file
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.unlink(missing_ok=True)  # Leftover from a crashed process with the same pid
+        try:
+            fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileNotFoundError:
+            # Directory was removed since we cached it
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            temp_path.replace(path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        _fsync_dir(path.parent)
         logger.debug(f"Saved file: {file_path}")
         return True
     except Exception as e:
@@ -734,15 +1128,16 @@ def save_content_to_file(content: str, file_path: str) -> bool:
 
 def add_frontmatter(content: str, metadata: Dict) -> str:
     """Add YAML frontmatter to content."""
-    frontmatter = "---\n"
-    for key, value in metadata.items():
-        if isinstance(value, (list, dict)):
-            frontmatter += f"{key}: {yaml.dump(value, default_flow_style=True).strip()}\n"
-        else:
-            frontmatter += f'{key}: "{value}"\n'
-    frontmatter += "---\n\n"
+    frontmatter = yaml.dump(
+        metadata,
+        Dumper=_YAML_DUMPER,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        width=_YAML_MAX_WIDTH
+    )
 
-    return frontmatter + content
+    return f"---\n{frontmatter}---\n\n{content}"
 
 
 def get_content_folder_path(beirek_area: str, beirek_subarea: str = None,
@@ -772,27 +1167,54 @@ def add_content_proposal(article_id: int, beirek_area: str, beirek_subarea: str,
                         key_talking_points: str = None,
                         confidence_score: float = None) -> int:
     """Add a content proposal (stored as pending approval)."""
-    storage = get_storage()
-
-    article = {
-        'id': article_id,
-        'title': suggested_title,
-        'url': '',
-        'summary': brief_description or ''
-    }
-
-    filter_result = {
-        'score': (confidence_score or 0.7) * 10,
-        'reason': content_angle,
+    return add_content_proposals_bulk([{
+        'article_id': article_id,
         'beirek_area': beirek_area,
         'beirek_subarea': beirek_subarea,
-        'confidence_score': confidence_score,
+        'suggested_title': suggested_title,
+        'content_angle': content_angle,
+        'brief_description': brief_description,
         'target_audience': target_audience,
-        'key_talking_points': key_talking_points
-    }
+        'key_talking_points': key_talking_points,
+        'confidence_score': confidence_score
+    }])[0]
 
-    approval_id = storage.add_pending_approval(article, filter_result)
-    return hash(approval_id) % 1000000  # Return numeric ID for compatibility
+
+def add_content_proposals_bulk(proposals: List[Dict]) -> List[int]:
+    """
+    Add several content proposals with a single pending approvals write.
+
+    Args:
+        proposals: Dicts with the add_content_proposal keyword arguments
+
+    Returns:
+        Numeric proposal IDs in input order
+    """
+    items = []
+    for proposal in proposals:
+        confidence_score = proposal.get('confidence_score')
+
+        article = {
+            'id': proposal.get('article_id'),
+            'title': proposal.get('suggested_title', ''),
+            'url': '',
+            'summary': proposal.get('brief_description') or ''
+        }
+
+        filter_result = {
+            'score': (confidence_score or 0.7) * 10,
+            'reason': proposal.get('content_angle', ''),
+            'beirek_area': proposal.get('beirek_area', ''),
+            'beirek_subarea': proposal.get('beirek_subarea', ''),
+            'confidence_score': confidence_score,
+            'target_audience': proposal.get('target_audience'),
+            'key_talking_points': proposal.get('key_talking_points')
+        }
+
+        items.append((article, filter_result))
+
+    approvals = get_storage()._append_approvals(items)
+    return [approval['number'] for approval in approvals]
 
 
 def get_proposals_by_status(status: str = 'suggested', limit: int = 50) -> List[Dict]:
@@ -800,9 +1222,9 @@ def get_proposals_by_status(status: str = 'suggested', limit: int = 50) -> List[
     storage = get_storage()
 
     if status == 'suggested':
-        return storage.get_pending_approvals()[:limit]
+        return storage.get_pending_approvals(limit)
     elif status == 'accepted':
-        return storage.get_approved_articles()[:limit]
+        return storage.get_approved_articles(limit)
     else:
         return []
 
@@ -847,17 +1269,25 @@ def get_today_proposals() -> List[Dict]:
 def get_proposal_stats() -> Dict[str, int]:
     """Get proposal statistics."""
     storage = get_storage()
-    data = storage._load_json(storage.pending_approvals_file, {})
+    cached = storage._get_cached_stats('proposal_stats')
+    if cached is not None:
+        return cached
 
-    return {
-        'suggested': len(data.get('pending', [])),
-        'accepted': len(data.get('approved', [])),
-        'rejected': len(data.get('rejected', [])),
+    # Counts come from the in-memory approvals view; no re-parse unless the file changed
+    counts = storage.get_approval_counts()
+
+    stats = {
+        'suggested': counts['pending'],
+        'accepted': counts['approved'],
+        'rejected': counts['rejected'],
         'outline_created': 0,
-        'content_generated': len([a for a in data.get('approved', []) if a.get('content_generated')]),
-        'today_total': len(data.get('pending', []))
+        'content_generated': counts['approved'] - len(storage._approved_ungenerated),
+        'today_total': counts['pending']
     }
 
+    storage._set_cached_stats('proposal_stats', stats)
+    return stats
+
 
 # Dummy functions for unused features
 def update_article_relevance(*args, **kwargs): pass
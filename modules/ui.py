@@ -11,29 +11,51 @@ Features:
 - Statistics display
 """
 
+import json
+import re
+from functools import lru_cache
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.markdown import Markdown
-from rich.text import Text
+from rich.prompt import Prompt, Confirm
 from rich import box
-from typing import List, Dict, Optional
-
-
-class TerminalUI:
-    """
-    Terminal user interface for BEIREK Content Scout.
-    """
-
-    def __init__(self):
-        self.console = Console()
-        self.cli_available = True  # Will be set by main.py
-
-    def show_banner(self):
-        """Display application banner."""
-        banner = """
+from typing import List, Dict, Optional, Tuple
+
+# Score styles indexed by how many thresholds a score clears (6/8 or 0.6/0.8)
+_SCORE_STYLES = ("red", "yellow", "green")
+
+# Formats for generation menu options 1-4
+_ALL_FORMATS = ('article', 'linkedin', 'twitter')
+_GENERATION_FORMATS = (
+    ('article',),
+    ('linkedin',),
+    ('twitter',),
+    _ALL_FORMATS
+)
+
+# Proposal list commands: q, a*, n/p paging, or a/d/r followed by comma separated numbers
+_PROPOSAL_CMD_RE = re.compile(r'^(?:(q|a\*|n|p)|([adr])\s*(\d+(?:\s*,\s*\d+)*))$')
+
+# Statistics table rows as (stats key, label)
+_STAT_LABELS = (
+    ('total_sources', 'Toplam Kaynak'),
+    ('total_articles', 'Toplam Makale'),
+    ('relevant_articles', 'Ilgili Makale'),
+    ('processed_articles', 'Islenmis Makale'),
+    ('pending_articles', 'Bekleyen Makale'),
+    ('pending_proposals', 'Bekleyen Oneri'),
+    ('accepted_proposals', 'Kabul Edilen Oneri'),
+    ('ready_for_generation', 'Uretim Icin Hazir'),
+    ('total_content', 'Uretilen Icerik'),
+    ('today_content', 'Bugunku Icerik'),
+    ('total_concepts', 'Kullanilan Kavram'),
+    ('pending_requests', 'Bekleyen Istek'),
+    ('today_scans', 'Bugunku Tarama')
+)
+
+# Static renderables built once at import
+_BANNER = """
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║    ██████╗ ███████╗██╗██████╗ ███████╗██╗  ██╗               ║
@@ -47,24 +69,9 @@ class TerminalUI:
 ║                                                               ║
 ╚═══════════════════════════════════════════════════════════════╝
 """
-        self.console.print(banner, style="bold blue")
-
-    def show_main_menu(self, cli_available: bool = None) -> str:
-        """
-        Display main menu and get selection.
 
-        Args:
-            cli_available: Whether Claude CLI is available (uses self.cli_available if None)
-
-        Returns:
-            Selected menu option
-        """
-        if cli_available is None:
-            cli_available = self.cli_available
-
-        # Define menu items with CLI dependency flags
-        if cli_available:
-            menu_content = """
+# Main menu variants with CLI dependency flags
+_MENU_CONTENT_CLI = """
 [bold cyan]Ana Menu[/bold cyan]
 
   [1] Tara ve Filtrele (RSS + NewsData API)
@@ -77,9 +84,8 @@ class TerminalUI:
   [8] Ayarlar
   [0] Cikis
 """
-            valid_choices = ['0', '1', '2', '3', '4', '5', '6', '7', '8']
-        else:
-            menu_content = """
+
+_MENU_CONTENT_NO_CLI = """
 [bold cyan]Ana Menu[/bold cyan]
 
   [1] Tara (sadece tarama) [dim][CLI YOK - filtreleme devre disi][/dim]
@@ -96,14 +102,74 @@ class TerminalUI:
    Filtreleme ve icerik uretimi icin Claude CLI gereklidir.
    Kurulum: https://claude.ai/cli
 """
-            valid_choices = ['0', '1', '6', '7', '8']
 
-        menu = Panel(
-            menu_content,
-            title="BEIREK Content Scout",
-            border_style="blue" if cli_available else "yellow",
-            box=box.DOUBLE
-        )
+_MENU_CHOICES_CLI = ['0', '1', '2', '3', '4', '5', '6', '7', '8']
+_MENU_CHOICES_NO_CLI = ['0', '1', '6', '7', '8']
+
+_MENU_PANEL_CLI = Panel(
+    _MENU_CONTENT_CLI,
+    title="BEIREK Content Scout",
+    border_style="blue",
+    box=box.DOUBLE
+)
+
+_MENU_PANEL_NO_CLI = Panel(
+    _MENU_CONTENT_NO_CLI,
+    title="BEIREK Content Scout",
+    border_style="yellow",
+    box=box.DOUBLE
+)
+
+
+def _truncate(text: str, width: int, suffix: str = '') -> str:
+    """Cut text to width characters, appending suffix only when it was cut."""
+    if len(text) > width:
+        return text[:width] + suffix
+    return text
+
+
+@lru_cache(maxsize=256)
+def _parse_key_points(raw: str) -> Tuple[str, ...]:
+    """Parse a JSON list of talking points; malformed input yields an empty tuple."""
+    try:
+        points = json.loads(raw)
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return ()
+    return tuple(points) if isinstance(points, list) else ()
+
+
+class TerminalUI:
+    """
+    Terminal user interface for BEIREK Content Scout.
+    """
+
+    def __init__(self):
+        self.console = Console()
+        self.cli_available = True  # Will be set by main.py
+
+    def show_banner(self):
+        """Display application banner."""
+        # Plain box-drawing text: no markup to parse and nothing to highlight
+        self.console.print(_BANNER, style="bold blue", highlight=False, markup=False, soft_wrap=True)
+
+    def show_main_menu(self, cli_available: bool = None) -> str:
+        """
+        Display main menu and get selection.
+
+        Args:
+            cli_available: Whether Claude CLI is available (uses self.cli_available if None)
+
+        Returns:
+            Selected menu option
+        """
+        if cli_available is None:
+            cli_available = self.cli_available
+
+        # Menu panels and choices are static; only pick the variant
+        if cli_available:
+            menu, valid_choices = _MENU_PANEL_CLI, _MENU_CHOICES_CLI
+        else:
+            menu, valid_choices = _MENU_PANEL_NO_CLI, _MENU_CHOICES_NO_CLI
 
         self.console.print(menu)
         choice = Prompt.ask("\n[bold]Seciminiz[/bold]", choices=valid_choices)
@@ -117,6 +183,9 @@ class TerminalUI:
         Returns:
             Progress context manager
         """
+        # Only the scan flow needs progress bars; import on first use
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -155,12 +224,13 @@ class TerminalUI:
         table.add_column("BEIREK Alanı", width=15)
 
         for i, article in enumerate(articles, 1):
+            title = article.get('title', '') or ''
             score = article.get('relevance_score', 0)
-            score_style = "green" if score >= 8 else "yellow" if score >= 6 else "red"
+            score_style = _SCORE_STYLES[(score >= 6) + (score >= 8)]
 
             table.add_row(
                 str(i),
-                article.get('title', '')[:48] + ('...' if len(article.get('title', '')) > 48 else ''),
+                _truncate(title, 48, '...'),
                 f"[{score_style}]{score:.0f}/10[/{score_style}]",
                 article.get('source_name', 'N/A')[:18],
                 article.get('beirek_area', '')[:13]
@@ -224,30 +294,24 @@ class TerminalUI:
 
         choice = Prompt.ask("\n[bold]Seçiminiz[/bold]", choices=['1', '2', '3', '4'], default='4')
 
-        format_map = {
-            '1': ['article'],
-            '2': ['linkedin'],
-            '3': ['twitter'],
-            '4': ['article', 'linkedin', 'twitter']
-        }
-
-        return format_map.get(choice, ['article', 'linkedin', 'twitter'])
+        # Prompt.ask only returns one of the listed choices
+        return list(_GENERATION_FORMATS[int(choice) - 1])
 
     def show_generation_progress(self, article_title: str, current_format: str = None):
         """Show content generation progress."""
+        # Formats before the current one are done; an unknown format marks all done
+        if not current_format:
+            current = -1
+        elif current_format in _ALL_FORMATS:
+            current = _ALL_FORMATS.index(current_format)
+        else:
+            current = len(_ALL_FORMATS)
+
         status = {
-            'article': '[ ]',
-            'linkedin': '[ ]',
-            'twitter': '[ ]'
+            fmt: '[✓]' if i < current else '[◐]' if i == current else '[ ]'
+            for i, fmt in enumerate(_ALL_FORMATS)
         }
 
-        if current_format:
-            for fmt in ['article', 'linkedin', 'twitter']:
-                if fmt == current_format:
-                    status[fmt] = '[◐]'
-                    break
-                status[fmt] = '[✓]'
-
         self.console.print(f"\n[bold]Üretiliyor:[/bold] {article_title[:50]}...")
         self.console.print(f"  {status['article']} Makale")
         self.console.print(f"  {status['linkedin']} LinkedIn")
@@ -255,13 +319,11 @@ class TerminalUI:
 
     def show_summary(self, stats: Dict):
         """Display operation summary."""
-        content = ""
-
-        for key, value in stats.items():
-            if isinstance(value, dict):
-                continue
-            label = key.replace('_', ' ').title()
-            content += f"[bold]{label}:[/bold] {value}\n"
+        content = "".join(
+            f"[bold]{key.replace('_', ' ').title()}:[/bold] {value}\n"
+            for key, value in stats.items()
+            if not isinstance(value, dict)
+        )
 
         panel = Panel(
             content,
@@ -283,25 +345,8 @@ class TerminalUI:
         table.add_column("Metrik", style="bold")
         table.add_column("Değer", justify="right")
 
-        stat_labels = {
-            'total_sources': 'Toplam Kaynak',
-            'total_articles': 'Toplam Makale',
-            'relevant_articles': 'Ilgili Makale',
-            'processed_articles': 'Islenmis Makale',
-            'pending_articles': 'Bekleyen Makale',
-            'pending_proposals': 'Bekleyen Oneri',
-            'accepted_proposals': 'Kabul Edilen Oneri',
-            'ready_for_generation': 'Uretim Icin Hazir',
-            'total_content': 'Uretilen Icerik',
-            'today_content': 'Bugunku Icerik',
-            'total_concepts': 'Kullanilan Kavram',
-            'pending_requests': 'Bekleyen Istek',
-            'today_scans': 'Bugunku Tarama'
-        }
-
-        for key, label in stat_labels.items():
-            value = stats.get(key, 0)
-            table.add_row(label, str(value))
+        for key, label in _STAT_LABELS:
+            table.add_row(label, str(stats.get(key, 0)))
 
         self.console.print(table)
 
@@ -344,17 +389,18 @@ class TerminalUI:
         table.add_column("Durum", width=12)
 
         for i, req in enumerate(requests, 1):
+            status = req['status']
             brief_status = "✓" if req.get('has_brief') else "✗"
             topic = req.get('brief_content', {}).get('topic', '-')[:28]
 
-            status_style = "green" if req['status'] == 'completed' else "yellow"
+            status_style = "green" if status == 'completed' else "yellow"
 
             table.add_row(
                 str(i),
                 req['folder_name'][:33],
                 topic,
                 brief_status,
-                f"[{status_style}]{req['status']}[/{status_style}]"
+                f"[{status_style}]{status}[/{status_style}]"
             )
 
         self.console.print(table)
@@ -374,12 +420,13 @@ class TerminalUI:
         )
         self.console.print(panel)
 
-    def show_proposal_list(self, proposals: List[Dict]) -> Dict:
+    def show_proposal_list(self, proposals: List[Dict], page_size: int = 20) -> Dict:
         """
         Display proposals and get accept/reject decisions.
 
         Args:
             proposals: List of proposal dicts
+            page_size: Number of proposals rendered per page
 
         Returns:
             Dict with 'accepted' and 'rejected' lists of proposal IDs
@@ -388,16 +435,91 @@ class TerminalUI:
             self.console.print("[yellow]Gosterilecek oneri yok.[/yellow]")
             return {'accepted': [], 'rejected': []}
 
-        # Build the display
+        page_size = max(1, page_size)
+        page_count = (len(proposals) + page_size - 1) // page_size
+        page = 0
+        self._show_proposal_page(proposals, page, page_size, page_count)
+
+        # Get user input
+        result = {'accepted': [], 'rejected': []}
+        # Sets mirror the result lists for O(1) duplicate checks; lists keep input order
+        accepted_ids, rejected_ids = set(), set()
+
+        while True:
+            cmd = Prompt.ask("\n[bold]Komut[/bold]")
+            match = _PROPOSAL_CMD_RE.match(cmd.strip().lower())
+
+            if not match:
+                self.console.print("[red]Gecersiz komut! (a, r, d, veya q kullanin)[/red]")
+                continue
+
+            command, action, args = match.groups()
+
+            if command == 'q':
+                break
+            elif command in ('n', 'p'):
+                target = page + 1 if command == 'n' else page - 1
+                if 0 <= target < page_count:
+                    page = target
+                    self._show_proposal_page(proposals, page, page_size, page_count)
+                else:
+                    self.console.print("[yellow]Baska sayfa yok.[/yellow]")
+                continue
+            elif command == 'a*':
+                result['accepted'] = [p.get('id') for p in proposals if p.get('id')]
+                self.console.print(f"[green]Tum oneriler kabul edildi ({len(result['accepted'])} adet)[/green]")
+                break
+
+            # The pattern only admits comma separated digits, so int() cannot fail
+            indices = [int(x) for x in args.split(',')]
+
+            if action == 'd':
+                # Detail view
+                if len(indices) != 1:
+                    self.console.print("[red]Gecersiz komut![/red]")
+                elif 0 < indices[0] <= len(proposals):
+                    self.show_proposal_detail(proposals[indices[0] - 1])
+                else:
+                    self.console.print("[red]Gecersiz numara![/red]")
+            else:
+                # Accept or reject
+                if action == 'a':
+                    decided, seen, message = result['accepted'], accepted_ids, "[green]#{} kabul edildi[/green]"
+                else:
+                    decided, seen, message = result['rejected'], rejected_ids, "[yellow]#{} reddedildi[/yellow]"
+
+                for idx in indices:
+                    if 0 < idx <= len(proposals):
+                        pid = proposals[idx - 1].get('id')
+                        if pid and pid not in seen:
+                            seen.add(pid)
+                            decided.append(pid)
+                            self.console.print(message.format(idx))
+                    else:
+                        self.console.print(f"[red]Gecersiz numara: {idx}[/red]")
+
+            # Check if all proposals have been processed
+            processed = len(result['accepted']) + len(result['rejected'])
+            if processed == len(proposals):
+                break
+
+        return result
+
+    def _show_proposal_page(self, proposals: List[Dict], page: int, page_size: int, page_count: int):
+        """Render one page of proposals followed by the command help."""
+        title = f"Icerik Onerileri ({len(proposals)} adet)"
+        if page_count > 1:
+            title += f" - Sayfa {page + 1}/{page_count}"
         header = Panel(
-            f"[bold cyan]Icerik Onerileri ({len(proposals)} adet)[/bold cyan]",
+            f"[bold cyan]{title}[/bold cyan]",
             border_style="cyan",
             box=box.DOUBLE
         )
         self.console.print(header)
 
-        # Display each proposal
-        for i, proposal in enumerate(proposals, 1):
+        # Display this page only; numbers stay global across pages
+        start = page * page_size
+        for i, proposal in enumerate(proposals[start:start + page_size], start + 1):
             score = proposal.get('confidence_score')
             if score is None:
                 score_display = "N/A"
@@ -405,7 +527,7 @@ class TerminalUI:
             else:
                 score = float(score)
                 score_display = f"{score * 10:.1f}"
-                score_style = "green" if score >= 0.8 else "yellow" if score >= 0.6 else "red"
+                score_style = _SCORE_STYLES[(score >= 0.6) + (score >= 0.8)]
 
             # Get BEIREK area display
             area = proposal.get('beirek_area', '')
@@ -427,79 +549,15 @@ class TerminalUI:
         self.console.print("  [cyan]r4,5[/cyan]   - 4, 5 numarali onerileri reddet")
         self.console.print("  [cyan]a*[/cyan]     - Tum onerileri kabul et")
         self.console.print("  [cyan]d3[/cyan]     - 3 numarali onerinin detayini goster")
+        if page_count > 1:
+            self.console.print("  [cyan]n[/cyan] / [cyan]p[/cyan]  - Sonraki / onceki sayfa")
         self.console.print("  [cyan]q[/cyan]      - Cikis")
 
-        # Get user input
-        result = {'accepted': [], 'rejected': []}
-
-        while True:
-            cmd = Prompt.ask("\n[bold]Komut[/bold]")
-            cmd = cmd.strip().lower()
-
-            if cmd == 'q':
-                break
-            elif cmd == 'a*':
-                result['accepted'] = [p.get('id') for p in proposals if p.get('id')]
-                self.console.print(f"[green]Tum oneriler kabul edildi ({len(result['accepted'])} adet)[/green]")
-                break
-            elif cmd.startswith('d'):
-                # Detail view
-                try:
-                    idx = int(cmd[1:])
-                    if 0 < idx <= len(proposals):
-                        self.show_proposal_detail(proposals[idx - 1])
-                    else:
-                        self.console.print("[red]Gecersiz numara![/red]")
-                except ValueError:
-                    self.console.print("[red]Gecersiz komut![/red]")
-            elif cmd.startswith('a'):
-                # Accept
-                try:
-                    indices = [int(x.strip()) for x in cmd[1:].split(',')]
-                    for idx in indices:
-                        if 0 < idx <= len(proposals):
-                            pid = proposals[idx - 1].get('id')
-                            if pid and pid not in result['accepted']:
-                                result['accepted'].append(pid)
-                                self.console.print(f"[green]#{idx} kabul edildi[/green]")
-                        else:
-                            self.console.print(f"[red]Gecersiz numara: {idx}[/red]")
-                except ValueError:
-                    self.console.print("[red]Gecersiz komut![/red]")
-            elif cmd.startswith('r'):
-                # Reject
-                try:
-                    indices = [int(x.strip()) for x in cmd[1:].split(',')]
-                    for idx in indices:
-                        if 0 < idx <= len(proposals):
-                            pid = proposals[idx - 1].get('id')
-                            if pid and pid not in result['rejected']:
-                                result['rejected'].append(pid)
-                                self.console.print(f"[yellow]#{idx} reddedildi[/yellow]")
-                        else:
-                            self.console.print(f"[red]Gecersiz numara: {idx}[/red]")
-                except ValueError:
-                    self.console.print("[red]Gecersiz komut![/red]")
-            else:
-                self.console.print("[red]Gecersiz komut! (a, r, d, veya q kullanin)[/red]")
-
-            # Check if all proposals have been processed
-            processed = len(result['accepted']) + len(result['rejected'])
-            if processed == len(proposals):
-                break
-
-        return result
-
     def show_proposal_detail(self, proposal: Dict):
         """Display detailed proposal information."""
-        import json
-
         key_points = proposal.get('key_talking_points', '[]')
         if isinstance(key_points, str):
-            try:
-                key_points = json.loads(key_points)
-            except (json.JSONDecodeError, TypeError, ValueError):
-                key_points = []
+            key_points = _parse_key_points(key_points)
 
         points_text = "\n".join([f"  - {p}" for p in key_points]) if key_points else "  (Yok)"
 
@@ -563,12 +621,15 @@ Kaynak: {proposal.get('source_name', 'N/A')}
         for i, proposal in enumerate(proposals, 1):
             folder = proposal.get('folder_path', '')
             if folder:
-                folder = folder.split('/')[-1][:28]
+                folder = folder.rsplit('/', 1)[-1][:28]
+
+            area = proposal.get('beirek_area', '')
+            subarea = proposal.get('beirek_subarea', '')
 
             table.add_row(
                 str(i),
                 proposal.get('suggested_title', '')[:43],
-                f"{proposal.get('beirek_area', '')}.{proposal.get('beirek_subarea', '')}",
+                f"{area}.{subarea}",
                 folder
             )
 
@@ -655,7 +716,7 @@ Kaynak: {proposal.get('source_name', 'N/A')}
             title = art.get('title', 'Baslik Yok')
             source = art.get('source_name', 'Kaynak Bilinmiyor')
             url = art.get('url', '')
-            summary = art.get('summary', '')[:300]
+            summary = _truncate(art.get('summary', ''), 300, '...')
             published = art.get('published_at', '')
 
             # Get filter result info
@@ -666,14 +727,14 @@ Kaynak: {proposal.get('source_name', 'N/A')}
 
             # Format score with color
             score_val = float(score) if score else 0
-            score_style = "green" if score_val >= 8 else "yellow" if score_val >= 6 else "red"
+            score_style = _SCORE_STYLES[(score_val >= 6) + (score_val >= 8)]
 
             # Build detail panel
             detail_content = f"""
 [bold]{i}/{len(articles)}. {title}[/bold]
 
 [bold]Kaynak:[/bold] {source}
-[bold]URL:[/bold] {url[:60]}{'...' if len(url) > 60 else ''}
+[bold]URL:[/bold] {_truncate(url, 60, '...')}
 [bold]Tarih:[/bold] {published}
 
 [bold]Relevance Skoru:[/bold] [{score_style}]{score_val:.1f}/10[/{score_style}]
@@ -681,7 +742,7 @@ Kaynak: {proposal.get('source_name', 'N/A')}
 [bold]Neden Secildi:[/bold] {reason}
 
 [bold]Ozet:[/bold]
-{summary}{'...' if len(art.get('summary', '')) > 300 else ''}
+{summary}
 """
 
             panel = Panel(
@@ -0,0 +1,51 @@
+"""
+Shared pytest configuration and fixtures.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project root importable for every test module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.framer import ContentFramer
+from modules.generator import ContentGenerator
+from modules.ui import TerminalUI
+
+# Written against the removed SQLite layer (DatabaseConnection, proposal CRUD
+# with validation); FolderStorage is covered by test_folder_storage.py
+collect_ignore = ["test_storage.py"]
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: tests that call the external Claude CLI")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless the -m expression selects on them (e.g. -m integration)."""
+    if 'integration' in config.option.markexpr:
+        return
+    skip_integration = pytest.mark.skip(reason="integration test, run with -m integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+# Tests only read from these objects, so one instance per session is enough.
+# The *_initializes tests construct their own to check a fresh setup.
+
+@pytest.fixture(scope="session")
+def framer():
+    return ContentFramer()
+
+
+@pytest.fixture(scope="session")
+def generator():
+    return ContentGenerator()
+
+
+@pytest.fixture(scope="session")
+def ui():
+    return TerminalUI()
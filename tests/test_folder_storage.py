@@ -0,0 +1,271 @@
+"""
+Tests for the folder-based storage module.
+"""
+
+import json
+import shutil
+
+import pytest
+import yaml
+
+import modules.storage as storage_module
+from modules.config_manager import ConfigManager
+from modules.storage import (
+    STRUCTURE_SENTINEL, FolderStorage, add_content_proposals_bulk, add_frontmatter,
+    generate_slug, sanitize_path_component, save_content_to_file, url_batch
+)
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """FolderStorage rooted in tmp_path and installed as the module singleton."""
+    monkeypatch.setattr(ConfigManager, 'base_path', property(lambda self: tmp_path))
+    store = FolderStorage()
+    monkeypatch.setattr(storage_module, '_storage', store)
+    return store
+
+
+def _urls_on_disk(storage):
+    return json.loads(storage.processed_urls_file.read_text(encoding='utf-8'))['urls']
+
+
+class TestGenerateSlug:
+    """Tests for slug generation."""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("Güneş Enerjisi Yatırımı", "gunes-enerjisi-yatirimi"),  # lower case Turkish letters
+        ("ĞÜŞÖÇ ğüşöç", "gusoc-gusoc"),                          # upper and lower case pairs
+        ("İSTANBUL ÇIKIŞ", "istanbul-cikis"),                    # dotted İ and ASCII I
+        ("Iğdır ılık", "igdir-ilik"),                            # dotless ı
+        ("Solar: 500MW Project!", "solar-500mw-project"),        # punctuation collapses to hyphens
+        ("", "untitled"),
+        ("!!!", "untitled"),
+        ("a" * 30 + " " + "b" * 30, "a" * 30),                  # cut at the last hyphen before 50
+    ])
+    def test_slug(self, title, expected):
+        """Test transliteration, case folding and length limiting."""
+        assert generate_slug(title) == expected
+
+
+class TestSanitizePathComponent:
+    """Tests for path sanitization."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("4-project-finance", "4-project-finance"),  # normal input passes through
+        ("../../../etc", "etc"),                     # path traversal
+        ("path/to/file", "pathtofile"),              # slashes
+        ("path\\to\\file", "pathtofile"),            # backslashes
+        ("", ""),                                    # empty string
+        ("file<>:\"|?*name", "filename"),            # dangerous characters
+        ("....//x", "x"),                            # '..' pairs removed left to right
+        ("a./.b", "a..b"),                           # removals do not rescan for new '..'
+    ])
+    def test_sanitizes(self, value, expected):
+        """Test that unsafe path parts are stripped."""
+        assert sanitize_path_component(value) == expected
+
+
+class TestUrlBatch:
+    """Tests for deferred processed URL writes."""
+
+    def test_marks_are_visible_before_the_flush(self, storage):
+        """Test that batched URLs are processed in memory but not yet written."""
+        with storage.url_batch():
+            storage.mark_url_processed('https://a.example/1', {'title': 'One'})
+            assert storage.is_url_processed('https://a.example/1')
+            assert not storage.processed_urls_file.exists()
+
+        assert _urls_on_disk(storage)['https://a.example/1']['title'] == 'One'
+
+    def test_flushes_when_the_block_raises(self, storage):
+        """Test that marks are written even if the batch exits with an exception."""
+        with pytest.raises(RuntimeError):
+            with url_batch():
+                storage.mark_urls_processed([('https://a.example/1', None), ('https://a.example/2', None)])
+                raise RuntimeError("scan aborted")
+
+        assert set(_urls_on_disk(storage)) == {'https://a.example/1', 'https://a.example/2'}
+
+    def test_flushes_at_the_batch_size(self, storage, monkeypatch):
+        """Test that a long batch writes once URL_BATCH_FLUSH_SIZE marks pile up."""
+        monkeypatch.setattr(storage_module, 'URL_BATCH_FLUSH_SIZE', 3)
+        with storage.url_batch():
+            storage.mark_urls_processed([(f'https://a.example/{i}', None) for i in range(3)])
+            assert len(_urls_on_disk(storage)) == 3
+
+    def test_nested_batches_flush_once_at_the_outermost_exit(self, storage):
+        """Test that an inner batch exit does not write."""
+        with storage.url_batch():
+            with storage.url_batch():
+                storage.mark_url_processed('https://a.example/1')
+            assert not storage.processed_urls_file.exists()
+        assert 'https://a.example/1' in _urls_on_disk(storage)
+
+    def test_merges_urls_written_by_another_process(self, storage):
+        """Test that the flush keeps URLs added on disk while the batch was open."""
+        with storage.url_batch():
+            storage.mark_url_processed('https://a.example/mine')
+            # Another process writes its own mark in the meantime
+            storage.processed_urls_file.write_text(
+                json.dumps({'urls': {'https://b.example/theirs': {'processed_at': 'x'}}}),
+                encoding='utf-8'
+            )
+
+        assert set(_urls_on_disk(storage)) == {'https://a.example/mine', 'https://b.example/theirs'}
+        assert storage.is_url_processed('https://b.example/theirs')
+
+
+class TestProposalNumbering:
+    """Tests for sequential proposal numbers."""
+
+    @staticmethod
+    def _proposals(count):
+        return [{'suggested_title': f'Title {i}', 'beirek_area': '4'} for i in range(count)]
+
+    def test_numbers_continue_after_reload(self, storage, monkeypatch):
+        """Test that the persisted counter keeps numbers sequential across instances."""
+        first = add_content_proposals_bulk(self._proposals(3))
+
+        # Moving records between buckets must not free their numbers
+        storage.approve_article(storage.get_pending_approvals()[0]['id'])
+        storage.reject_article(storage.get_pending_approvals()[0]['id'])
+
+        monkeypatch.setattr(storage_module, '_storage', FolderStorage())
+        second = add_content_proposals_bulk(self._proposals(2))
+
+        assert first == [1, 2, 3]
+        assert second == [4, 5]
+        data = json.loads(storage.pending_approvals_file.read_text(encoding='utf-8'))
+        assert data['next_number'] == 6
+
+    def test_legacy_file_falls_back_to_highest_number(self, storage):
+        """Test that a file without next_number continues after its highest number."""
+        storage.pending_approvals_file.write_text(json.dumps({
+            'pending': [{'id': 'a', 'number': 3}],
+            'approved': [{'id': 'b', 'number': 7}],
+            'rejected': [{'id': 'c', 'number': 5}]
+        }), encoding='utf-8')
+
+        assert add_content_proposals_bulk(self._proposals(2)) == [8, 9]
+        assert add_content_proposals_bulk(self._proposals(1)) == [10]
+
+
+class TestSaveContentToFile:
+    """Tests for atomic content file writes."""
+
+    def test_writes_file_without_leftovers(self, tmp_path):
+        """Test that a successful write leaves only the target file."""
+        target = tmp_path / 'rapor' / 'makale.md'
+        assert save_content_to_file("İçerik", str(target))
+        assert target.read_text(encoding='utf-8') == "İçerik"
+        assert [p.name for p in target.parent.iterdir()] == ['makale.md']
+
+    def test_unencodable_content_leaves_no_temp_file(self, tmp_path):
+        """Test that a lone surrogate fails cleanly and keeps the old file."""
+        target = tmp_path / 'makale.md'
+        target.write_text("old", encoding='utf-8')
+
+        assert not save_content_to_file("bad \ud800", str(target))
+        assert target.read_text(encoding='utf-8') == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ['makale.md']
+
+    def test_failed_write_removes_temp_file(self, tmp_path, monkeypatch):
+        """Test that an error after the temp file exists cleans it up."""
+        target = tmp_path / 'makale.md'
+        target.write_text("old", encoding='utf-8')
+
+        def failing_fsync(fd):
+            raise OSError("disk full")
+        monkeypatch.setattr(storage_module.os, 'fsync', failing_fsync)
+
+        assert not save_content_to_file("new", str(target))
+        assert target.read_text(encoding='utf-8') == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ['makale.md']
+
+    def test_recreates_a_removed_directory(self, tmp_path):
+        """Test that a folder deleted after the first write is created again."""
+        target = tmp_path / 'rapor' / 'makale.md'
+        assert save_content_to_file("one", str(target))
+        target.unlink()
+        target.parent.rmdir()
+
+        assert save_content_to_file("two", str(target))
+        assert target.read_text(encoding='utf-8') == "two"
+
+
+class TestAddFrontmatter:
+    """Tests for YAML frontmatter."""
+
+    METADATA = {
+        'title': "Project finance: " + "structuring in Turkey " * 5,
+        'beirek_area': '4',
+        'beirek_subarea': '3',
+        'date': '2026-10-15',
+        'score': 8.5,
+        'source': 'Güneş Haber',
+        'tags': ['solar', 'finance']
+    }
+
+    def _split(self, text):
+        assert text.startswith("---\n")
+        frontmatter, body = text[4:].split("---\n\n", 1)
+        return frontmatter, body
+
+    def test_round_trips_through_safe_load(self):
+        """Test that values, types and key order survive a YAML round trip."""
+        frontmatter, body = self._split(add_frontmatter("Body text", self.METADATA))
+        loaded = yaml.safe_load(frontmatter)
+        assert loaded == self.METADATA
+        assert list(loaded) == list(self.METADATA)
+        assert body == "Body text"
+
+    def test_quotes_ambiguous_strings(self):
+        """Test that numeric and date-like strings stay strings."""
+        frontmatter, _ = self._split(add_frontmatter("", self.METADATA))
+        assert "beirek_area: '4'\n" in frontmatter
+        assert "date: '2026-10-15'\n" in frontmatter
+        assert "source: Güneş Haber\n" in frontmatter
+
+    def test_long_titles_stay_on_one_line(self):
+        """Test that a long title containing ':' is not folded."""
+        frontmatter, _ = self._split(add_frontmatter("", self.METADATA))
+        title_line = frontmatter.splitlines()[0]
+        assert title_line.startswith("title: 'Project finance: ")
+        assert yaml.safe_load(title_line)['title'] == self.METADATA['title']
+
+
+class TestEnsureStructure:
+    """Tests for the folder layout sentinel."""
+
+    def test_matching_sentinel_skips_the_sweep(self, storage):
+        """Test that a second init trusts the sentinel and does not recreate folders."""
+        removed = storage._structure_paths()[0]
+        assert removed.is_dir()
+        removed.rmdir()
+
+        FolderStorage()
+        assert not removed.exists()
+
+    def test_force_recreates_missing_folders(self, storage):
+        """Test that force=True checks every folder despite the sentinel."""
+        removed = storage._structure_paths()[0]
+        removed.rmdir()
+
+        storage.ensure_structure(force=True)
+        assert removed.is_dir()
+
+    def test_layout_change_triggers_the_sweep(self, storage):
+        """Test that a different folder layout is created and recorded."""
+        storage.reports_folder = 'raporlar-yeni'
+        storage.ensure_structure()
+
+        assert all(path.is_dir() for path in storage._structure_paths())
+        sentinel = storage.data_path / STRUCTURE_SENTINEL
+        assert sentinel.read_text(encoding='utf-8') == storage._structure_signature()
+
+    def test_missing_content_folder_triggers_the_sweep(self, storage):
+        """Test that a deleted content folder is rebuilt even with a matching sentinel."""
+        shutil.rmtree(storage.content_path)
+
+        storage.ensure_structure()
+        assert all(path.is_dir() for path in storage._structure_paths())
@@ -3,32 +3,19 @@ Tests for generator module.
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from modules.generator import (
-    ContentGenerator, GeneratorError,
-    TWITTER_MAX_CHARS, TWITTER_TRUNCATE_SUFFIX, TWITTER_TRUNCATE_LENGTH
-)
+from modules.generator import ContentGenerator, GeneratorError
+from modules.config_manager import Constants
 
 
 class TestConstants:
     """Tests for module constants."""
 
-    def test_twitter_max_chars(self):
-        """Test Twitter max chars constant."""
-        assert TWITTER_MAX_CHARS == 280
-
-    def test_twitter_truncate_suffix(self):
-        """Test Twitter truncate suffix."""
-        assert TWITTER_TRUNCATE_SUFFIX == "..."
-
-    def test_twitter_truncate_length(self):
-        """Test Twitter truncate length is calculated correctly."""
-        assert TWITTER_TRUNCATE_LENGTH == 277
+    def test_twitter_constants(self):
+        """Test Twitter limits and that truncation leaves room for the suffix."""
+        assert Constants.TWITTER_MAX_CHARS == 280
+        assert Constants.TWITTER_TRUNCATE_SUFFIX == "..."
+        assert Constants.TWITTER_TRUNCATE_LENGTH == 277
 
 
 class TestContentGeneratorInit:
@@ -50,10 +37,6 @@ class TestContentGeneratorInit:
 class TestFormatTwitterThread:
     """Tests for Twitter thread formatting."""
 
-    @pytest.fixture
-    def generator(self):
-        return ContentGenerator()
-
     def test_formats_numbered_tweets(self, generator):
         """Test that tweets are properly numbered."""
         raw_content = """1/ First tweet here
@@ -76,16 +59,12 @@ class TestFormatTwitterThread:
 
         # Should be truncated to 280 or less
         first_tweet = formatted.split('\n\n')[0]
-        assert len(first_tweet) <= TWITTER_MAX_CHARS
+        assert len(first_tweet) <= Constants.TWITTER_MAX_CHARS
 
 
 class TestGenerateFromProposal:
     """Tests for proposal-based generation."""
 
-    @pytest.fixture
-    def generator(self):
-        return ContentGenerator()
-
     @pytest.fixture
     def sample_proposal(self):
         return {
@@ -109,10 +88,6 @@ class TestGenerateFromProposal:
 class TestValidateContent:
     """Tests for content validation."""
 
-    @pytest.fixture
-    def generator(self):
-        return ContentGenerator()
-
     def test_validate_finds_suspicious_numbers(self, generator):
         """Test that validation flags numbers not in source."""
         source = "The project cost $100 million."
@@ -132,7 +107,3 @@ class TestValidateContent:
         # Should have no warnings about mismatched numbers
         number_warnings = [w for w in warnings if 'olmayan' in w]
         assert len(number_warnings) == 0
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -3,14 +3,9 @@ Tests for storage module.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from modules.storage import (
-    DatabaseConnection, init_database, sanitize_path_component,
+    DatabaseConnection, init_database,
     get_content_folder_path, add_content_proposal, get_proposals_by_status,
     get_proposal_by_id, update_proposal_status, accept_proposal, reject_proposal,
     get_proposal_stats
@@ -41,34 +36,6 @@ class TestDatabaseConnection:
         # This is implicitly tested by the proposal tests below
 
 
-class TestSanitizePathComponent:
-    """Tests for path sanitization."""
-
-    def test_normal_input(self):
-        """Test normal input passes through."""
-        assert sanitize_path_component("4-project-finance") == "4-project-finance"
-
-    def test_removes_path_traversal(self):
-        """Test that ../ is removed."""
-        assert sanitize_path_component("../../../etc") == "etc"
-
-    def test_removes_slashes(self):
-        """Test that slashes are removed."""
-        assert sanitize_path_component("path/to/file") == "pathtofile"
-
-    def test_removes_backslashes(self):
-        """Test that backslashes are removed."""
-        assert sanitize_path_component("path\\to\\file") == "pathtofile"
-
-    def test_empty_string(self):
-        """Test empty string returns empty."""
-        assert sanitize_path_component("") == ""
-
-    def test_removes_dangerous_chars(self):
-        """Test that dangerous characters are removed."""
-        assert sanitize_path_component("file<>:\"|?*name") == "filename"
-
-
 class TestGetContentFolderPath:
     """Tests for content folder path generation."""
 
@@ -260,7 +227,3 @@ class TestContentProposals:
         assert 'outline_created' in stats
         assert 'content_generated' in stats
         assert 'today_total' in stats
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -2,14 +2,51 @@
 Tests for UI module.
 """
 
-import pytest
-import sys
-from pathlib import Path
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import io
 
-from modules.ui import TerminalUI
+import pytest
+from rich.console import Console
+
+from modules.ui import TerminalUI, _parse_key_points
+
+
+# Read-only sample data shared by the display tests
+SAMPLE_PROPOSALS = (
+    {
+        'id': 1,
+        'suggested_title': 'Test Proposal 1',
+        'content_angle': 'Test angle 1',
+        'confidence_score': 0.9,
+        'beirek_area': '4',
+        'beirek_subarea': '3',
+        'source_name': 'Test Source'
+    },
+    {
+        'id': 2,
+        'suggested_title': 'Test Proposal 2',
+        'content_angle': 'Test angle 2',
+        'confidence_score': 0.0,  # Edge case: zero score
+        'beirek_area': '5',
+        'beirek_subarea': '1',
+        'source_name': 'Test Source 2'
+    },
+    {
+        'id': 3,
+        'suggested_title': 'Test Proposal 3',
+        'content_angle': 'Test angle 3',
+        'confidence_score': None,  # Edge case: None score
+        'beirek_area': '6',
+        'beirek_subarea': '2',
+        'source_name': 'Test Source 3'
+    }
+)
+
+
+# 45 proposals -> pages of 20, 20 and 5 at the default page size
+MANY_PROPOSALS = tuple(
+    {'id': i, 'suggested_title': f'Proposal {i}', 'confidence_score': 0.5}
+    for i in range(1, 46)
+)
 
 
 class TestTerminalUIInit:
@@ -25,41 +62,9 @@ class TestTerminalUIInit:
 class TestProposalDisplay:
     """Tests for proposal display functionality."""
 
-    @pytest.fixture
-    def ui(self):
-        return TerminalUI()
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_proposals(self):
-        return [
-            {
-                'id': 1,
-                'suggested_title': 'Test Proposal 1',
-                'content_angle': 'Test angle 1',
-                'confidence_score': 0.9,
-                'beirek_area': '4',
-                'beirek_subarea': '3',
-                'source_name': 'Test Source'
-            },
-            {
-                'id': 2,
-                'suggested_title': 'Test Proposal 2',
-                'content_angle': 'Test angle 2',
-                'confidence_score': 0.0,  # Edge case: zero score
-                'beirek_area': '5',
-                'beirek_subarea': '1',
-                'source_name': 'Test Source 2'
-            },
-            {
-                'id': 3,
-                'suggested_title': 'Test Proposal 3',
-                'content_angle': 'Test angle 3',
-                'confidence_score': None,  # Edge case: None score
-                'beirek_area': '6',
-                'beirek_subarea': '2',
-                'source_name': 'Test Source 3'
-            }
-        ]
+        return SAMPLE_PROPOSALS
 
     def test_score_display_normal(self, sample_proposals):
         """Test that normal scores display correctly."""
@@ -92,13 +97,88 @@ class TestProposalDisplay:
             assert score_display == "N/A"
 
 
+@pytest.fixture
+def run_list(monkeypatch):
+    """Run show_proposal_list on scripted commands; returns (result, console text)."""
+    def run(commands, proposals=SAMPLE_PROPOSALS, **kwargs):
+        ui = TerminalUI()
+        ui.console = Console(record=True, width=100, file=io.StringIO())
+        answers = iter(commands)
+        monkeypatch.setattr("modules.ui.Prompt.ask", lambda *args, **kw: next(answers))
+        result = ui.show_proposal_list(list(proposals), **kwargs)
+        return result, ui.console.export_text()
+    return run
+
+
+class TestProposalListCommands:
+    """Tests for the interactive proposal list commands."""
+
+    def test_accept_and_reject_finish_the_list(self, run_list):
+        """Test that deciding every proposal ends the loop without q."""
+        result, _ = run_list(['a1', 'r2', 'a3'])
+        assert result == {'accepted': [1, 3], 'rejected': [2]}
+
+    def test_space_separated_numbers_are_rejected(self, run_list):
+        """Test that 'a1 2' is an invalid command instead of a crash."""
+        result, output = run_list(['a1 2', 'r3 4', 'q'])
+        assert result == {'accepted': [], 'rejected': []}
+        assert output.count("Gecersiz komut! (a, r, d, veya q kullanin)") == 2
+
+    def test_detail_needs_a_single_number(self, run_list):
+        """Test that d1,2 is refused and d2 shows the detail panel."""
+        _, output = run_list(['d1,2', 'd2', 'q'])
+        assert "Gecersiz komut!" in output
+        assert output.count("Oneri Detayi") == 1
+
+    def test_paging_commands_on_a_single_page(self, run_list):
+        """Test that n and p report there is no other page."""
+        result, output = run_list(['n', 'p', 'q'])
+        assert result == {'accepted': [], 'rejected': []}
+        assert output.count("Baska sayfa yok.") == 2
+
+
+class TestProposalListPaging:
+    """Tests for proposal list pagination."""
+
+    def test_renders_only_the_first_page(self, run_list):
+        """Test that only page_size proposals are rendered up front."""
+        _, output = run_list(['q'], MANY_PROPOSALS)
+        assert "Sayfa 1/3" in output
+        assert "Proposal 20" in output
+        assert "Proposal 21" not in output
+        assert "Sonraki / onceki sayfa" in output
+
+    def test_next_and_previous_stop_at_the_ends(self, run_list):
+        """Test moving past either end reports there is no other page."""
+        _, output = run_list(['p', 'n', 'n', 'n', 'p', 'q'], MANY_PROPOSALS)
+        assert output.count("Baska sayfa yok.") == 2
+        assert output.count("Sayfa 1/3") == 1
+        assert output.count("Sayfa 2/3") == 2
+        assert output.count("Sayfa 3/3") == 1
+        assert "Proposal 45" in output
+
+    def test_numbers_are_global_across_pages(self, run_list):
+        """Test that numbers off the current page still resolve to the right proposal."""
+        result, output = run_list(['n', 'a25', 'a1', 'r45', 'a99', 'q'], MANY_PROPOSALS)
+        assert result == {'accepted': [25, 1], 'rejected': [45]}
+        assert "Gecersiz numara: 99" in output
+
+    def test_custom_page_size(self, run_list):
+        """Test that page_size controls how many proposals a page shows."""
+        _, output = run_list(['n', 'q'], MANY_PROPOSALS, page_size=40)
+        assert "Sayfa 2/2" in output
+        assert "Proposal 41" in output
+
+    def test_single_page_has_no_paging(self, run_list):
+        """Test that a list fitting one page shows no page counter or n/p help."""
+        _, output = run_list(['q'], MANY_PROPOSALS, page_size=50)
+        assert "Sayfa" not in output
+        assert "Sonraki / onceki sayfa" not in output
+
+
 class TestProposalDetail:
     """Tests for proposal detail display."""
 
-    @pytest.fixture
-    def ui(self):
-        return TerminalUI()
-
     def test_show_proposal_detail_with_json_points(self, ui):
         """Test that JSON key points are parsed correctly."""
         proposal = {
@@ -115,18 +195,14 @@ class TestProposalDetail:
             'source_name': 'Test Source'
         }
 
-        # This should not raise an exception
-        import json
-        key_points = proposal.get('key_talking_points', '[]')
-        if isinstance(key_points, str):
-            try:
-                key_points = json.loads(key_points)
-            except (json.JSONDecodeError, TypeError, ValueError):
-                key_points = []
-
-        assert len(key_points) == 3
-        assert key_points[0] == "Point 1"
+        with ui.console.capture() as capture:
+            ui.show_proposal_detail(proposal)
+        output = capture.get()
 
+        for point in ("Point 1", "Point 2", "Point 3"):
+            assert f"- {point}" in output
+        assert "(Yok)" not in output
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+        key_points = _parse_key_points(proposal['key_talking_points'])
+        assert key_points == ("Point 1", "Point 2", "Point 3")
+        assert _parse_key_points("not json") == ()